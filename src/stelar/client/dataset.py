@@ -1,5 +1,3 @@
-from IPython.core.display import HTML
-
 from .generic import GenericCursor, GenericProxy
 from .proxy import (
     BoolField,
@@ -17,16 +15,117 @@ from .proxy import (
     TagList,
     UUIDField,
 )
-from .resource import Resource
+from .resource import _WATERMARK_IMAGE_URL, Resource
 from .utils import client_for
 from .vocab import Tag
 
+# The static parts of Dataset._repr_html_(), filled in by %-formatting.
+# The watermark is constant, so it is filled in once, at import.
+_DATASET_SUMMARY_HTML = """
+    <div style="position: relative; width: 100%%; height: auto; display: flex; justify-content: flex-start; align-items: flex-start; margin-bottom: 20px;">
+        <table border="1" style="
+            border-collapse: collapse;
+            width: 50%%;
+            margin: 0;
+            color: black;
+            background-image: url('%(watermark)s');
+            background-size: 20%%;
+            background-position: center;
+            background-repeat: no-repeat;">
+            <thead>
+                <tr>
+                    <th colspan="2" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
+                        Dataset Summary
+                    </th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">ID:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(id)s</td>
+                </tr>
+                <tr style="background-color: rgba(230, 179, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Title:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(title)s</td>
+                </tr>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Notes:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(notes)s</td>
+                </tr>
+                <tr style="background-color: rgba(230, 179, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Tags:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(tags)s</td>
+                </tr>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Modified Date:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(metadata_modified)s</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """.replace("%(watermark)s", _WATERMARK_IMAGE_URL)
+
+_DATASET_RESOURCES_HTML = """
+    <div style="position: relative; width: 100%%; height: auto; display: flex; justify-content: flex-start; align-items: start;">
+        <table border="1" style="
+            border-collapse: collapse;
+            width: 80%%;
+            margin: 0;
+            color: black;
+            background-image: url('%(watermark)s');
+            background-size: 20%%;
+            background-position: center;
+            background-repeat: no-repeat;">
+            <thead>
+                <tr>
+                    <th colspan="5" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
+                        Dataset Resources
+                    </th>
+                </tr>
+                <tr style="background-color: rgba(242, 242, 242, 0.8);">
+                    <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">ID</th>
+                    <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Relation to Parent</th>
+                    <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Name</th>
+                    <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">URL</th>
+                    <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Format</th>
+                </tr>
+            </thead>
+            <tbody>
+                %(resources)s
+            </tbody>
+        </table>
+    </div>
+    """.replace("%(watermark)s", _WATERMARK_IMAGE_URL)
+
+_DATASET_RESOURCE_ROW_HTML = """
+    <tr style="background-color: %(background)s;">
+        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(id)s</td>
+        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(name)s</td>
+        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;"><a href="%(url)s" target="_blank">%(url)s</a></td>
+        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(format)s</td>
+    </tr>
+    """
+
+# Alternating (even, odd) row templates, with the background baked in
+_DATASET_RESOURCE_ROWS = tuple(
+    _DATASET_RESOURCE_ROW_HTML.replace("%(background)s", background)
+    for background in ("rgba(255, 255, 255, 0.8)", "rgba(230, 179, 255, 0.8)")
+)
+
+_DATASET_NO_RESOURCES_HTML = """
+    <tr style="background-color: rgba(255, 255, 255, 0.8);">
+        <td colspan='5' style="text-align: center; padding: 10px; border: 1px solid #ddd;">No Resources Associated</td>
+    </tr>
+    """
+
 
 class Dataset(GenericProxy, ExtrasProxy, TaggableProxy):
     """
     A proxy of a STELAR dataset.
     """
 
+    __slots__ = ()
+
     id = Id()
     name = NameId()
     metadata_created = Property(validator=DateField)
@@ -87,110 +186,41 @@ class Dataset(GenericProxy, ExtrasProxy, TaggableProxy):
         with enhanced styles, watermark, and consistent formatting.
         """
         # Build the HTML for the resources table
-        resources_html = ""
-        if self.resources:
+        resources = self.resources
+        if resources:
+            rows = _DATASET_RESOURCE_ROWS
             resources_html = "".join(
-                f"""
-                <tr style="background-color: {('rgba(255, 255, 255, 0.8)' if i % 2 == 0 else 'rgba(230, 179, 255, 0.8)')};">
-                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{resource.id or 'N/A'}</td>
-                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{resource.name}</td>
-                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;"><a href="{resource.url}" target="_blank">{resource.url}</a></td>
-                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{resource.format}</td>
-                </tr>
-                """
-                for i, resource in enumerate(self.resources)
+                [
+                    rows[i & 1]
+                    % {
+                        "id": resource.id or "N/A",
+                        "name": resource.name,
+                        "url": resource.url,
+                        "format": resource.format,
+                    }
+                    for i, resource in enumerate(resources)
+                ]
             )
         else:
-            resources_html = """
-                <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                    <td colspan='5' style="text-align: center; padding: 10px; border: 1px solid #ddd;">No Resources Associated</td>
-                </tr>
-            """
-
-        # Define the watermark image URL (Replace with your image path)
-        watermark_image_url = "logo.png"
+            resources_html = _DATASET_NO_RESOURCES_HTML
 
         # Build the Dataset Summary table
-        summary_html = f"""
-        <div style="position: relative; width: 100%; height: auto; display: flex; justify-content: flex-start; align-items: flex-start; margin-bottom: 20px;">
-            <table border="1" style="
-                border-collapse: collapse;
-                width: 50%;
-                margin: 0;
-                color: black;
-                background-image: url('{watermark_image_url}');
-                background-size: 20%;
-                background-position: center;
-                background-repeat: no-repeat;">
-                <thead>
-                    <tr>
-                        <th colspan="2" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
-                            Dataset Summary
-                        </th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">ID:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.id or 'N/A'}</td>
-                    </tr>
-                    <tr style="background-color: rgba(230, 179, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Title:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.title}</td>
-                    </tr>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Notes:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.notes}</td>
-                    </tr>
-                    <tr style="background-color: rgba(230, 179, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Tags:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{', '.join(['self.tags'])}</td>
-                    </tr>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Modified Date:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.metadata_modified or 'N/A'}</td>
-                    </tr>
-                </tbody>
-            </table>
-        </div>
-        """
+        summary_html = _DATASET_SUMMARY_HTML % {
+            "id": self.id or "N/A",
+            "title": self.title,
+            "notes": self.notes,
+            "tags": ", ".join(self.tags),
+            "metadata_modified": self.metadata_modified or "N/A",
+        }
 
         # Build the Dataset Resources table
-        resources_table_html = f"""
-        <div style="position: relative; width: 100%; height: auto; display: flex; justify-content: flex-start; align-items: start;">
-            <table border="1" style="
-                border-collapse: collapse;
-                width: 80%;
-                margin: 0;
-                color: black;
-                background-image: url('{watermark_image_url}');
-                background-size: 20%;
-                background-position: center;
-                background-repeat: no-repeat;">
-                <thead>
-                    <tr>
-                        <th colspan="5" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
-                            Dataset Resources
-                        </th>
-                    </tr>
-                    <tr style="background-color: rgba(242, 242, 242, 0.8);">
-                        <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">ID</th>
-                        <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Relation to Parent</th>
-                        <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Name</th>
-                        <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">URL</th>
-                        <th style="text-align: left; padding: 5px; border: 1px solid #ddd;">Format</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {resources_html}
-                </tbody>
-            </table>
-        </div>
-        """
+        resources_table_html = _DATASET_RESOURCES_HTML % {
+            "resources": resources_html,
+        }
 
         # Combine both tables into the final HTML
         html = f"{summary_html}<br>{resources_table_html}"
-        return HTML(html)._repr_html_()
+        return html
 
     def __disabled_str__(self):
         dataset_info = f"""Title: {self.title} | Dataset ID: {self.id} | Name: {self.name} | Tags: {self.tags} | Modified Date: {self.modified_date}\nDataset Resources:\n"""
@@ -186,6 +186,8 @@ def generic_delete(proxy: Proxy, purge=False):
 
 
 class GenericProxy(Proxy, entity=False):
+    __slots__ = ()
+
     def delete(self, purge=False):
         """
         Delete the entity proxied by this proxy.
@@ -224,6 +226,9 @@ class GenericProxyList(ProxyList):
     def resolve_proxy(self, item):
         return generic_get(self.client, self.proxy_type, item)
 
+    def sublist(self, s: slice) -> GenericProxyList:
+        return GenericProxyList(self.coll[s], self.client, self.proxy_type)
+
 
 class GenericCursor(ProxyCursor[ProxyClass]):
     def create(self, **prop) -> ProxyClass:
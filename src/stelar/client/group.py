@@ -25,6 +25,11 @@ class MemberList(ProxyVec):
         super().__init__(client, proxy_type, members)
         self.capacities = capacities
 
+    def sublist(self, s: slice) -> "MemberList":
+        return MemberList(
+            self.client, self.proxy_type, self.members[s], self.capacities[s]
+        )
+
     def to_df(self, *additional, fields=None):
         df = super().to_df(*additional, fields=fields)
         return df.assign(capacity=self.capacities)
@@ -57,6 +62,8 @@ class GroupBase(GenericProxy, ExtrasProxy, entity=False):
     defined later.
     """
 
+    __slots__ = ()
+
     id = Id()
     name = NameId()
     is_organization = Property(validator=BoolField)
@@ -99,8 +106,8 @@ class GroupBase(GenericProxy, ExtrasProxy, entity=False):
 
 
 class Group(GroupBase):
-    pass
+    __slots__ = ()
 
 
 class Organization(GroupBase):
-    pass
+    __slots__ = ()
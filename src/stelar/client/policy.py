@@ -1,6 +1,4 @@
 from typing import List, Dict
-from IPython.core.display import HTML
-from IPython.display import display
 
     
 class Policy:
@@ -224,7 +222,7 @@ class Policy:
             </table>
         </div>
         """
-        return HTML(html)._repr_html_()
+        return html
 
     def present_dictionaries_as_tables(dicts_list):
         """
@@ -235,6 +233,8 @@ class Policy:
         Parameters:
             dicts_list (list of dict): A list of dictionaries to present.
         """
+        from IPython.display import HTML, display
+
         # Generate HTML tables with the desired style
         html_content = ""
         for idx, data in enumerate(dicts_list):
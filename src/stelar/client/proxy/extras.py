@@ -26,15 +26,23 @@ This field should not be accessed directly, instead its contents
 are available as normal attributes.
 """
 
-    def get(self, obj):
-        """Low-level getter"""
-        if obj.proxy_attr is None:
-            obj.proxy_sync()
-        return obj.proxy_attr[self.name]
-
     def __get__(self, obj, obj_type=None):
         return self.get(obj).copy()
 
+    def touch(self, obj):
+        """Copy-on-write version of touch.
+
+        The extras dict is updated in place, one key at a time. On the first
+        update, the original dict is kept in 'proxy_changed' (for proxy_reset())
+        and 'proxy_attr' receives a copy. Subsequent updates do not copy.
+        """
+        if obj.proxy_changed is not None and self.name in obj.proxy_changed:
+            return
+        super().touch(obj)
+        extras = obj.proxy_attr[self.name]
+        if extras is not ...:
+            obj.proxy_attr[self.name] = extras.copy()
+
     def convert_entity_to_proxy(self, proxy: Proxy, entity, **kwargs):
         entity_extras = entity.get(self.entity_name, {})
         proxy_extras = entity_extras.copy()  #  Do we need a copy here?
@@ -80,6 +88,8 @@ class ExtrasProxy(Proxy, entity=False):
     dynamic attributes.
     """
 
+    __slots__ = ()
+
     # def __init__(self, *args, **kwargs):
     #    for a in [
     #        'proxy_id', 'proxy_attr', 'proxy_changed',
@@ -94,10 +104,11 @@ class ExtrasProxy(Proxy, entity=False):
             raise AttributeError(attr) from e
 
     def __setattr__(self, attr, value):
-        if attr.startswith("proxy_") or attr in self.proxy_schema.all_fields:
+        schema = self.proxy_schema
+        if attr.startswith("proxy_") or attr in schema.all_fields:
             return object.__setattr__(self, attr, value)
 
-        extras_property = self.proxy_schema.extras
+        extras_property = schema.extras
         value = extras_property.item_validator.validate(value)
         extras_property.touch(self)
         extras_property.get(self)[attr] = value
@@ -105,14 +116,15 @@ class ExtrasProxy(Proxy, entity=False):
             self.proxy_sync()
 
     def __delattr__(self, attr):
-        if attr.startswith("proxy_") or attr in self.proxy_schema.all_fields:
+        schema = self.proxy_schema
+        if attr.startswith("proxy_") or attr in schema.all_fields:
             return object.__delattr__(self, attr)
 
-        extras_property = self.proxy_schema.extras
+        extras_property = schema.extras
         extras = extras_property.get(self)
         if attr in extras:
             extras_property.touch(self)
-            del extras[attr]
+            del extras_property.get(self)[attr]
             if self.proxy_autosync:
                 self.proxy_sync()
         else:
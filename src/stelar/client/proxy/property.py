@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from io import StringIO
+import sys
 from typing import TYPE_CHECKING, Any
 
 from .exceptions import EntityError
 from .fieldvalidation import AnyField, NameField, UUIDField
 from .proxy import Proxy
+from .proxylist import ShortenedUUID
 
 if TYPE_CHECKING:
     from ..client import Client
@@ -13,6 +14,29 @@ if TYPE_CHECKING:
 Entity = dict[str, Any]
 
 
+class PropertyDoc:
+    """The '__doc__' attribute of properties.
+
+    The documentation of a property is only computed (by 'autodoc()') when
+    it is first accessed on the property. Accessed on a property class,
+    it returns the class docstring.
+    """
+
+    def __init__(self, classdoc):
+        self.classdoc = classdoc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self.classdoc
+        doc = obj.autodoc(
+            obj.doc, obj.validator.repr_type(), obj.validator.repr_constraints()
+        )
+        if obj.owner is not None:
+            # cache it (this is not a data descriptor)
+            obj.__dict__["__doc__"] = doc
+        return doc
+
+
 class Property:
     """A Python descriptor for implementing access and updating of
     fields of proxy objects.
@@ -68,27 +92,34 @@ class Property:
             self.validator = validator()
         else:
             self.validator = validator
+        # Cache the bound conversion methods of the validator
+        self._validate = self.validator.validate
+        self._to_proxy = self.validator.convert_to_proxy
+        self._to_entity = self.validator.convert_to_entity
         self.entity_name = entity_name
         self.owner = self.name = None
         self.create_default = create_default
         self.short = short
         self.doc = doc
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__doc__ = PropertyDoc(cls.__dict__.get("__doc__"))
+
     def autodoc(self, doc, repr_type, repr_constraints):
         INDENT = "    "
-        out = StringIO()
 
         typespec = str(repr_type)
         constraints = list(repr_constraints)
 
-        if "nullable" in repr_constraints:
+        if "nullable" in constraints:
             typespec += "|None"
             constraints.remove("nullable")
 
         if doc is None:
             doc = f"The '{self.name}' field"
 
-        f = [typespec]
+        f = [INDENT, typespec]
 
         fp = []
         if not self.updatable:
@@ -105,8 +136,7 @@ class Property:
         if self.entity_name != self.name:
             f += ["JSON field:", self.entity_name]
 
-        print(INDENT, *f, file=out)
-        return out.getvalue()
+        return " ".join(f) + "\n"
 
     @property
     def qualname(self):
@@ -125,9 +155,8 @@ class Property:
         self.name = name
         if self.entity_name is None:
             self.entity_name = name
-        self.__doc__ = self.autodoc(
-            self.doc, self.validator.repr_type(), self.validator.repr_constraints()
-        )
+        else:
+            self.entity_name = sys.intern(self.entity_name)
 
     # def check_value(self, value):
     #    if value is ... and not self.optional:
@@ -150,9 +179,11 @@ class Property:
 
     def get(self, obj):
         """Low-level getter"""
-        if obj.proxy_attr is None:
+        attr = obj.proxy_attr
+        if attr is None:
             obj.proxy_sync()
-        return obj.proxy_attr[self.name]
+            attr = obj.proxy_attr
+        return attr[self.name]
 
     def touch(self, obj):
         """Transition the initial value of a clean proxy to the
@@ -161,24 +192,40 @@ class Property:
         This is done only on the first update to an attribute,
         in order to allow for the proxy_reset() functionality.
         """
-        if obj.proxy_changed is None:
+        attr = obj.proxy_attr
+        if attr is None:
+            obj.proxy_sync()
+            attr = obj.proxy_attr
+        changed = obj.proxy_changed
+        if changed is None:
             # Initialize proxy_changed on clean object
-            if obj.proxy_attr is None:
-                obj.proxy_sync()
-            obj.proxy_changed = {self.name: obj.proxy_attr[self.name]}
-        elif self.name not in obj.proxy_changed:
+            obj.proxy_changed = {self.name: attr[self.name]}
+        else:
             # Record only first change
-            obj.proxy_changed[self.name] = obj.proxy_attr[self.name]
+            changed.setdefault(self.name, attr[self.name])
 
     def validate(self, obj, value):
-        return self.validator.validate(value)
+        return self._validate(value)
 
     def set(self, obj, value):
-        """Low-level setter"""
+        """Low-level setter.
+
+        This is equivalent to 'touch()' followed by an update of the value,
+        but it loads 'proxy_attr' and 'proxy_changed' only once.
+        """
         value = self.validate(obj, value)
-        self.touch(obj)
+        name = self.name
+        attr = obj.proxy_attr
+        if attr is None:
+            obj.proxy_sync()
+            attr = obj.proxy_attr
+        changed = obj.proxy_changed
+        if changed is None:
+            obj.proxy_changed = {name: attr[name]}
+        else:
+            changed.setdefault(name, attr[name])
         # update the value
-        obj.proxy_attr[self.name] = value
+        attr[name] = value
 
     def convert_entity_to_proxy(self, proxy: Proxy, entity: Any, **kwargs):
         """Update proxy dict to represent this property from the entity"""
@@ -193,9 +240,7 @@ class Property:
                 ) from e
 
         proxy.proxy_attr[self.name] = (
-            self.validator.convert_to_proxy(entity_value, **kwargs)
-            if entity_value is not None
-            else None
+            self._to_proxy(entity_value, **kwargs) if entity_value is not None else None
         )
 
     def convert_proxy_to_entity(self, proxy: Proxy, entity: dict, **kwargs):
@@ -209,9 +254,7 @@ class Property:
         if proxy_value is None:
             entity[self.entity_name] = None
         else:
-            entity[self.entity_name] = self.validator.convert_to_entity(
-                proxy_value, **kwargs
-            )
+            entity[self.entity_name] = self._to_entity(proxy_value, **kwargs)
 
     def convert_to_create(
         self, proxy_type: type, create_props: Entity, entity_props: Entity, **kwargs
@@ -227,19 +270,21 @@ class Property:
         if self.name not in create_props:
             defval = self.missing(**kwargs)
             if defval is not ...:
-                entity_props[self.entity_name] = self.validator.convert_to_entity(
-                    defval, **kwargs
-                )
+                entity_props[self.entity_name] = self._to_entity(defval, **kwargs)
             return
 
         proxy_value = create_props[self.name]
-        proxy_value = self.validator.validate(proxy_value, **kwargs)
+        proxy_value = self._validate(proxy_value, **kwargs)
         if proxy_value is None:
             entity_value = None
         else:
-            entity_value = self.validator.convert_to_entity(proxy_value, **kwargs)
+            entity_value = self._to_entity(proxy_value, **kwargs)
         entity_props[self.entity_name] = entity_value
 
+    def simplify(self, value):
+        """Return a simpler representation of a value, for display."""
+        return value
+
     def __get__(self, obj, objtype=None):
         val = self.get(obj)
 
@@ -267,6 +312,9 @@ class Property:
         self.set(obj, ...)
 
 
+Property.__doc__ = PropertyDoc(Property.__doc__)
+
+
 class Id(Property):
     """A Python descriptor for implementing entity ID access."""
 
@@ -278,7 +326,15 @@ class Id(Property):
         )
         self.isId = True
 
+    # N.B. Id is a data descriptor (it defines __set__ and __delete__), so that
+    # its __get__ takes precedence over the instance dict.
+
+    def simplify(self, value):
+        return ShortenedUUID(value.hex)
+
     def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
         return obj.proxy_id
 
     def __set__(self, obj, value):
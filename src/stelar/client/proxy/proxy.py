@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
 from .decl import ProxyState
-from .exceptions import ConversionError, ErrorState, InvalidationError
+from .exceptions import ConversionError, EntityError, ErrorState, InvalidationError
 
 if TYPE_CHECKING:
     from pandas import Series
@@ -52,6 +52,20 @@ if TYPE_CHECKING:
 
 Entity = dict[str, Any]
 
+# The id of proxies for entities not yet created
+_ZERO_UUID = UUID(int=0)
+
+
+# The pandas module, imported on first use
+_pd = None
+
+
+def _pandas():
+    global _pd
+    if _pd is None:
+        import pandas as _pd
+    return _pd
+
 
 class Proxy:
     """Base class for all proxy objects of the STELAR entities.
@@ -103,17 +117,34 @@ class Proxy:
     proxy_sync(entity=None):  Make an entity CLEAN.
     """
 
+    # Entity proxies keep their state in slots (no per-instance __dict__).
+    # Subclasses should declare '__slots__ = ()' to retain this.
+    __slots__ = (
+        "proxy_registry",
+        "proxy_id",
+        "proxy_autosync",
+        "proxy_attr",
+        "proxy_changed",
+        "proxy_purged_id",
+        "proxy_deferred",
+        "__weakref__",
+    )
+
     proxy_registry: Registry
     proxy_id: Optional[UUID]
     proxy_autosync: bool
     proxy_attr: dict[str, Any] | None
     proxy_changed: dict[str, Any] | None
 
+    # The number of enclosing deferred_sync() blocks for this proxy
+    proxy_deferred: int
+
     def __init__(
         self, registry: Registry, eid: Optional[str | UUID] = None, entity=None
     ):
         self.proxy_registry = registry
         self.proxy_autosync = True
+        self.proxy_deferred = 0
 
         if eid is None and entity is None:
             raise ValueError(
@@ -137,10 +168,7 @@ class Proxy:
                         "Mismatch between entity ID provided directly and indirectly"
                     )
 
-        if not isinstance(eid, UUID):
-            self.proxy_id = UUID(eid)
-        else:
-            self.proxy_id = eid
+        self.proxy_id = eid if isinstance(eid, UUID) else UUID(eid)
 
         self.proxy_attr = None
         self.proxy_changed = None
@@ -193,7 +221,8 @@ class Proxy:
         """
         from .registry import Registry, RegistryCatalog
 
-        if not hasattr(cls, "proxy_schema"):
+        schema = getattr(cls, "proxy_schema", None)
+        if schema is None:
             raise TypeError(f"Class {cls.__name__} is not an entity class")
 
         if isinstance(regspec, RegistryCatalog):
@@ -203,20 +232,23 @@ class Proxy:
         else:
             raise TypeError("Expected Registry or RegistryCatalog for regspec")
 
-        schema = cls.proxy_schema
-        proxy = cls(registry, eid=UUID(int=0))
+        proxy = cls(registry, eid=_ZERO_UUID)
 
-        # Validate the given fields
-        validated_fields = {
-            name: schema.properties[name].validator.validate(value)
-            for name, value in fields.items()
-            if name in schema.all_fields
-        }
+        # Validate the given fields. If we have extras, use the extras
+        # field for any unrecognized items in fields
+        extras_prop = schema.extras
+        validated_fields = {}
+        extras = {}
+        for name, value in fields.items():
+            if name in schema.all_fields:
+                validated_fields[name] = schema.properties[name]._validate(value)
+            elif extras_prop is not None:
+                extras[name] = extras_prop.item_validator.validate(value)
 
         # For the missing fields, add the default, or ...
         # Adding ..., implies somehow that the field has been deleted (!)
-        for name, prop in schema.properties.items():
-            if not (prop.isId or prop.isExtras or name in validated_fields):
+        for name, prop in schema.defaultable_props:
+            if name not in validated_fields:
                 defval = prop.missing(proxy=proxy)
                 if defval is ...:
                     validated_fields[name] = ...
@@ -230,14 +262,8 @@ class Proxy:
                 # else:
                 #    validated_fields[name] = ...
 
-        # Finally, if we have extras, use extras field for any unrecognized
-        # items in fields
-        if schema.extras is not None:
-            validated_fields[schema.extras.name] = {
-                ename: schema.extras.item_validator.validate(evalue)
-                for ename, evalue in fields.items()
-                if ename not in validated_fields
-            }
+        if extras_prop is not None:
+            validated_fields[extras_prop.name] = extras
 
         # Set up the dictionaries of the proxy
         proxy.proxy_attr = validated_fields
@@ -255,16 +281,28 @@ class Proxy:
         ----
             fields: dict[str,Any]
         """
-        if not hasattr(cls, "proxy_schema"):
+        schema = getattr(cls, "proxy_schema", None)
+        if schema is None:
             raise TypeError(f"Class {cls.__name__} is not an entity class")
         entity_fields = {}
-        for property in cls.proxy_schema.properties.values():
-            property.convert_to_create(
-                cls,
-                fields,
-                entity_fields,
-                catalog=catalog,
-                registry=catalog.registry_for(cls) if catalog else None,
+        kwargs = {
+            "catalog": catalog,
+            "registry": catalog.registry_for(cls) if catalog else None,
+        }
+        plan = schema.create_plan
+        for prop, name, entity_name, validate, convert in plan:
+            if convert is None:
+                prop.convert_to_create(cls, fields, entity_fields, **kwargs)
+                continue
+            # This is Property.convert_to_create() inlined
+            if name not in fields:
+                defval = prop.missing(**kwargs)
+                if defval is not ...:
+                    entity_fields[entity_name] = convert(defval, **kwargs)
+                continue
+            value = validate(fields[name], **kwargs)
+            entity_fields[entity_name] = (
+                convert(value, **kwargs) if value is not None else None
             )
         return entity_fields
 
@@ -283,12 +321,20 @@ class Proxy:
 
     def update(self, **updates: Any):
         """Update a bunch of attributes in a single operation."""
+        properties = self.proxy_schema.properties
         with deferred_sync(self):
             for name, value in updates.items():
-                if value is ...:
-                    delattr(self, name)
+                prop = properties.get(name)
+                if prop is None:
+                    # Extras and other attributes
+                    if value is ...:
+                        delattr(self, name)
+                    else:
+                        setattr(self, name, value)
+                elif value is ...:
+                    prop.__delete__(self)
                 else:
-                    setattr(self, name, value)
+                    prop.__set__(self, value)
 
     @property
     def proxy_state(self) -> ProxyState:
@@ -329,8 +375,7 @@ class Proxy:
         if self.proxy_id is None:
             raise ErrorState()
         if self.proxy_changed is not None:
-            for name, value in self.proxy_changed.items():
-                self.proxy_attr[name] = value
+            self.proxy_attr.update(self.proxy_changed)
             self.proxy_changed = None
 
     def proxy_from_entity(self, entity: Any):
@@ -339,9 +384,23 @@ class Proxy:
             raise ErrorState()
         if self.proxy_attr is None:
             self.proxy_attr = dict()
-        for prop in self.proxy_schema.properties.values():
-            if not prop.isId:
+        attr = self.proxy_attr
+        plan = self.proxy_schema.from_entity_plan
+        for prop, name, entity_name, optional, convert in plan:
+            if convert is None:
                 prop.convert_entity_to_proxy(self, entity)
+                continue
+            # This is Property.convert_entity_to_proxy() inlined
+            if optional:
+                entity_value = entity.get(entity_name, ...)
+            else:
+                try:
+                    entity_value = entity[entity_name]
+                except KeyError as e:
+                    raise EntityError(
+                        f"Entity does not have attribute {entity_name}"
+                    ) from e
+            attr[name] = convert(entity_value) if entity_value is not None else None
 
     def proxy_to_entity(
         self, attrset: set[str] | dict[str, Any] | None = None
@@ -354,8 +413,8 @@ class Proxy:
             attrset (set of property names, optional): If not None,
                 determines the set of names to add to the entity.
 
-                Any type of object, where the expression
-                `name in attrset` is valid, can be used.
+                A set of names, or a dict whose keys are the names,
+                can be used. Names that are not properties are ignored.
 
                 Use this to only add names of changed properties to
                 an entity:
@@ -368,9 +427,13 @@ class Proxy:
         if self.proxy_id is None:
             raise ErrorState()
         entity = dict()
-        for prop in self.proxy_schema.properties.values():
-            if prop.isId or (attrset is not None and prop.name not in attrset):
-                continue
+        if attrset is None:
+            props = self.proxy_schema.property_list
+        else:
+            # Only visit the given names (typically, a few changed ones)
+            properties = self.proxy_schema.properties
+            props = [properties[name] for name in attrset if name in properties]
+        for prop in props:
             try:
                 prop.convert_proxy_to_entity(self, entity)
             except Exception as e:
@@ -421,16 +484,16 @@ class Proxy:
 
     def __repr__(self) -> str:
         typename = type(self).__name__
-        state = self.proxy_state.name
-        if self.proxy_state is ProxyState.ERROR:
+        state = self.proxy_state
+        if state is ProxyState.ERROR:
             nid = f"deleted ({getattr(self, 'proxy_purged_id', '**unknown**')})"
-        elif self.proxy_state is ProxyState.EMPTY:
+        elif state is ProxyState.EMPTY:
             nid = str(self.proxy_id)
         elif self.proxy_schema.name_id is not None:
             nid = self.name
         else:
             nid = str(self.proxy_id)
-        return f"<{typename} {nid} {state}>"
+        return f"<{typename} {nid} {state.name}>"
 
     def proxy_to_Series(
         self,
@@ -451,44 +514,38 @@ class Proxy:
             include_extras (bool, default=False): also include any extras fields
             simplify (bool, default=True): return a more printable, simpler representation
         """
-        import pandas as pd
+        pd = _pandas()
 
-        name = f"{type(self).__name__} ({self.proxy_state.name})"
-        if self.proxy_state is ProxyState.ERROR or (
-            not sync_empty and self.proxy_state is ProxyState.EMPTY
-        ):
+        state = self.proxy_state
+        name = f"{type(self).__name__} ({state.name})"
+        if state is ProxyState.ERROR or (not sync_empty and state is ProxyState.EMPTY):
             return pd.Series(name=name)
 
         schema = self.proxy_schema
 
-        def report_field(name):
-            return include_null or bool(getattr(self, name, False))
-
-        all_fields = [schema.id.name, *schema.properties]
+        # A dict is used as an ordered set of the field names
+        all_fields = dict.fromkeys([schema.id.name, *schema.properties])
         if include_extras and schema.extras is not None:
             extras = schema.extras.get(self)
             if extras is not ...:
-                all_fields.remove(schema.extras.name)
-                all_fields.extend(extras.keys())
-
-        index = [name for name in all_fields if report_field(name)]
-
-        def simplified(val):
-            match val:
-                case Proxy(proxy_schema=schema) if schema.name_id is not None:
-                    return val.name
-                case Proxy():
-                    return val.proxy_id
-                case _:
-                    return val
-
-        def propvalue(name):
-            value = getattr(self, name, ...)
-            if value is not ... and simplify:
-                value = simplified(value)
-            return value
-
-        data = [propvalue(name) for name in index]
+                del all_fields[schema.extras.name]
+                all_fields.update(dict.fromkeys(extras))
+
+        # Each field is read once, both to filter and to report it
+        index = []
+        data = []
+        for field in all_fields:
+            value = getattr(self, field, ...)
+            if not include_null and (value is ... or not value):
+                continue
+            if simplify and isinstance(value, Proxy):
+                if value.proxy_schema.name_id is not None:
+                    value = value.name
+                else:
+                    value = value.proxy_id
+            index.append(field)
+            data.append(value)
+
         return pd.Series(index=index, data=data, name=name, dtype="object")
 
     @property
@@ -520,16 +577,25 @@ class Proxy:
 
 @contextmanager
 def deferred_sync(*proxies):
-    if not all(isinstance(p, Proxy) for p in proxies):
-        raise TypeError("All arguments must be entity proxies")
-    for i, p in enumerate(proxies):
-        if any(q is p for q in proxies[i + 1 :]):
+    """Suspend autosync for the given proxies, and sync them once on exit.
+
+    Blocks can be nested (e.g., by calling Proxy.update() inside the block);
+    the proxies are only synced when the outermost block that entered them
+    exits.
+    """
+    seen = {}
+    for j, p in enumerate(proxies):
+        if not isinstance(p, Proxy):
+            raise TypeError("All arguments must be entity proxies")
+        i = seen.setdefault(id(p), j)
+        if i != j:
             raise ValueError(
                 f"The {i}-th argument appears again; proxies must be entered once"
             )
     saved_autosync = [p.proxy_autosync for p in proxies]
     for p in proxies:
         p.proxy_autosync = False
+        p.proxy_deferred += 1
     try:
         yield proxies
     except Exception:
@@ -540,18 +606,23 @@ def deferred_sync(*proxies):
     finally:
         for p, a in zip(proxies, saved_autosync):
             p.proxy_autosync = a
+            p.proxy_deferred -= 1
 
     # This belongs outside the finally clause.
     # It will not be executed if there is an error
     exc = []
     for p in proxies:
-        if p.proxy_state is ProxyState.DIRTY:
+        if p.proxy_deferred:
+            # Nested block: the enclosing deferred_sync() will sync it
+            continue
+        state = p.proxy_state
+        if state is ProxyState.DIRTY:
             try:
                 p.proxy_sync()
             except Exception as e:
                 p.proxy_reset()
                 exc.append((p, e.with_traceback(None)))
-        elif p.proxy_state is not ProxyState.ERROR:
+        elif state is not ProxyState.ERROR:
             p.proxy_sync()
     if exc:
         raise RuntimeError("Failed to sync, updates reset", exc)
@@ -15,24 +15,17 @@ ProxyClass = TypeVar("ProxyClass", bound=Proxy)
 
 
 class ShortenedUUID(UUID):
-    def __str__(self):
-        return f"{super().__str__()[:5]}..."
-
+    # The shortened string, computed on first use
+    __slots__ = ("short",)
 
-def simplified(value, property):
-    from .property import Id
-    from .refs import Reference
-
-    match property:
-        case Id():
-            return ShortenedUUID(value.hex)
-        case Reference(proxy_type=pt):
-            if pt.proxy_schema.name:
-                return value.name
-            else:
-                return ShortenedUUID(value.proxy_id.hex)
-        case _:
-            return value
+    def __str__(self):
+        try:
+            return self.short
+        except AttributeError:
+            short = f"{self.hex[:5]}..."
+            # UUID.__setattr__ forbids updates
+            object.__setattr__(self, "short", short)
+            return short
 
 
 class ProxyList(Generic[ProxyClass]):
@@ -43,6 +36,8 @@ class ProxyList(Generic[ProxyClass]):
     as if the list actually contained proxy objects.
     """
 
+    __slots__ = ("client", "proxy_type", "registry")
+
     def __init__(self, client: Client, proxy_type: Type[ProxyClass]):
         self.client = client
         self.proxy_type = proxy_type
@@ -59,21 +54,37 @@ class ProxyList(Generic[ProxyClass]):
         return self.registry.fetch_proxy(item)
 
     def __iter__(self):
+        resolve = self.resolve_proxy
         for item in self.coll:
-            yield self.resolve_proxy(item)
+            yield resolve(item)
 
     def __len__(self):
         return len(self.coll)
 
+    def sublist(self, s: slice) -> ProxyList:
+        """Return a proxy list for a slice of this list.
+
+        Only the underlying collection is sliced, proxies are
+        resolved on access.
+        """
+        return ProxyVec(self.client, self.proxy_type, self.coll[s])
+
     def __getitem__(self, item):
         if isinstance(item, slice):
-            raise ValueError("Slices are not supported yet")
+            return self.sublist(item)
         return self.resolve_proxy(self.coll[item])
 
     def __repr__(self):
         return f"{self.proxy_type.__name__}{repr(self.coll)}"
 
     def __eq__(self, other):
+        if (
+            isinstance(other, ProxyList)
+            and other.registry is self.registry
+            and self.coll == other.coll
+        ):
+            # The same elements resolve to the same proxies
+            return True
         try:
             return len(self) == len(other) and (
                 all(p == q for p, q in zip(self, other))
@@ -93,12 +104,13 @@ class ProxyList(Generic[ProxyClass]):
 
         if fields is None:
             fields = schema.short_list(set(additional_fields))
-        data = {field: list() for field in fields}
+        proxies = list(self)
 
-        for proxy in self:
-            for field in fields:
-                property = schema.all_fields[field]
-                data[field].append(simplified(getattr(proxy, field), property))
+        # Build the dataframe column by column
+        data = {}
+        for field in fields:
+            simplify = schema.all_fields[field].simplify
+            data[field] = [simplify(getattr(proxy, field)) for proxy in proxies]
         return pd.DataFrame(data=data)
 
     @property
@@ -113,6 +125,8 @@ class ProxyVec(ProxyList):
     correpsonding element is fetched from the registry.
     """
 
+    __slots__ = ("members",)
+
     def __init__(
         self, client: Client, proxy_type: Type[ProxyClass], members: list[ProxyClass]
     ):
@@ -129,6 +143,8 @@ class ProxySublist(ProxyList):
     on an entity sub-collection.
     """
 
+    __slots__ = ("property", "owner")
+
     def __init__(self, property: RefList, owner: Proxy):
         super().__init__(owner.proxy_registry.catalog, property.proxy_type)
         self.property = property
@@ -150,6 +166,8 @@ class ProxySublist(ProxyList):
 
 
 class ProxyCursor(Generic[ProxyClass]):
+    __slots__ = ("client", "proxy_type")
+
     MAX_FETCH = 1000
 
     def __init__(self, client: Client, proxy_type: Type[ProxyClass]):
@@ -170,30 +188,32 @@ class ProxyCursor(Generic[ProxyClass]):
         raise NotImplementedError
 
     def __getitem__(self, item: str | UUID | slice) -> ProxyClass | list[ProxyClass]:
-        if isinstance(item, slice):
-            offset = item.start if item.start is not None else 0
+        # The common case, access by name or id, is checked first
+        if isinstance(item, (str, UUID)):
+            proxy = self.get(item)
+            if proxy is None:
+                raise KeyError("Entity not found")
+            return proxy
+
+        elif isinstance(item, slice):
+            start, stop, step = item.start, item.stop, item.step
+            offset = start if start is not None else 0
             if offset < 0:
                 raise ValueError("Bad offset")
-            if item.step is not None:
-                limit = item.step
-            elif item.stop is not None:
-                limit = item.stop - offset
+            if step is not None:
+                limit = step
+            elif stop is not None:
+                limit = stop - offset
             else:
                 limit = self.MAX_FETCH
             if limit < 0:
                 raise ValueError("Bad limit")
             # CUT OFF
-            if limit > self.MAX_FETCH:
-                limit = self.MAX_FETCH
+            limit = min(limit, self.MAX_FETCH)
 
             return self.fetch_list(limit=limit, offset=offset)
             # return list(self.fetch(limit=limit, offset=offset))
 
-        elif isinstance(item, (str, UUID)):
-            proxy = self.get(item)
-            if proxy is None:
-                raise KeyError("Entity not found")
-            return proxy
         else:
             raise TypeError(
                 f"Cannot fetch {self.proxy_type.__name__} by {item}: string or UUID is expected"
@@ -17,11 +17,16 @@ class ProxySynclist:
     """A container for the proxies that need to be sync'd after
        an operation.
     """
-    
-    def __init__(self, l: list[Proxy] = []):
-        self.tosync = list()
-        for a in l:
-            self.add(a)
+
+    __slots__ = ("tosync",)
+
+    def __init__(self, l: Optional[list[Proxy]] = None):
+        # Proxies keyed by id(), each proxy is synced once and in order
+        self.tosync: dict[int, Proxy] = {}
+        if l:
+            add = self.add
+            for a in l:
+                add(a)
     
     def add(self, ref: Proxy|ProxyList):
         """Add a proxy or the elements of a proxy list to the synclist.
@@ -29,15 +34,15 @@ class ProxySynclist:
             Any other types are ignored.
         """
         if isinstance(ref, ProxyList):
+            # The elements of a proxy list are proxies
+            tosync = self.tosync
             for p in ref:
-                self.add(p)
+                tosync.setdefault(id(p), p)
         elif isinstance(ref, Proxy):
-            self.tosync.append(ref)
+            self.tosync.setdefault(id(ref), ref)
             
     def trigger_properties(self, schema: Schema):
-        for p in schema.properties.values():
-            if isinstance(p, Reference) and p.trigger_sync:
-                yield p
+        return schema.trigger_sync_properties
 
     def on_create(self, proxy_type: Type[ProxyClass], properties: dict[str, Any]):
         for p in self.trigger_properties(proxy_type.proxy_schema):
@@ -48,7 +53,7 @@ class ProxySynclist:
             self.add(p.get(proxy))
 
     def on_delete(self, proxy: Proxy):
-        for p in proxy.proxy_schema.properties.values():
+        for p in proxy.proxy_schema.property_list:
             self.add( getattr(proxy, p.name) )
 
     def on_update(self, proxy: Proxy, prop: Property, newref: Proxy):
@@ -58,7 +63,7 @@ class ProxySynclist:
             self.add(newref)
 
     def sync(self):
-        for prx in self.tosync:
+        for prx in self.tosync.values():
             prx.proxy_sync()
         self.tosync.clear()
 
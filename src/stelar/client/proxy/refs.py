@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from io import StringIO
 from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
 from uuid import UUID
@@ -8,7 +9,7 @@ from .exceptions import EntityError
 from .fieldvalidation import AnyField, NameField, UUIDField
 from .property import Property
 from .proxy import Proxy
-from .proxylist import ProxySublist
+from .proxylist import ProxySublist, ShortenedUUID
 from .registry import Registry
 
 if TYPE_CHECKING:
@@ -64,14 +65,19 @@ class Reference(Property):
         else:
             return proxy_type.__name__
 
-    @property
+    @cached_property
     def proxy_type(self):
-        """The class of the proxy object pointed to by this"""
-        if isinstance(self.__proxy_type, str):
+        """The class of the proxy object pointed to by this.
+
+        A class given by name is resolved on first access, since it
+        may be defined after this property.
+        """
+        proxy_type = self.__proxy_type
+        if isinstance(proxy_type, str):
             from .schema import Schema
 
-            self.__proxy_type = Schema.for_entity(self.__proxy_type).cls
-        return self.__proxy_type
+            proxy_type = Schema.for_entity(proxy_type).cls
+        return proxy_type
 
     def registry_for(self, obj) -> Registry:
         """Return the registry for the referrent, given owner"""
@@ -79,12 +85,11 @@ class Reference(Property):
 
     def get(self, obj):
         """Low-level getter"""
-        if obj.proxy_attr is None:
-            obj.proxy_sync()
-        if obj.proxy_attr[self.name] is None:
+        eid = super().get(obj)
+        if eid is None:
             return None
         else:
-            return self.registry_for(obj).fetch_proxy(obj.proxy_attr[self.name])
+            return self.registry_for(obj).fetch_proxy(eid)
 
     def __get__(self, obj, objtype=None):
         val = self.get(obj)
@@ -94,6 +99,14 @@ class Reference(Property):
             raise AttributeError(f"Property '{self.name}' is not present")
         return val
 
+    def simplify(self, value):
+        if value is None:
+            return None
+        elif self.proxy_type.proxy_schema.name_id is not None:
+            return value.name
+        else:
+            return ShortenedUUID(value.proxy_id.hex)
+
     # set and delete are inherited from Property
 
 
@@ -108,11 +121,8 @@ class RefList(Reference):
         ptnb = super().property_type_name(proxy_type)
         return f"List[{ptnb}]"
 
-    def get(self, obj):
-        """Low-level getter"""
-        if obj.proxy_attr is None:
-            obj.proxy_sync()
-        return obj.proxy_attr[self.name]
+    # The low-level getter returns the list of ids
+    get = Property.get
 
     def __get__(self, obj, obj_type=None):
         if obj.proxy_attr is None:
@@ -122,15 +132,20 @@ class RefList(Reference):
     def set(self, obj, value):
         raise NotImplementedError("Cannot set value of RefList field")
 
+    # The sublist is displayed as it is
+    simplify = Property.simplify
+
     def convert_entity_to_proxy(self, proxy, entity):
         entities = entity[self.entity_name]
         # entities is a list of entities, we need to fetch them from
         # our proxy's client.
         entity_id_name = self.proxy_type.proxy_schema.id.entity_name
         try:
-            proxy_ids = [UUID(e.get(entity_id_name)) for e in entities]
-        except Exception as e:
-            breakpoint()
+            proxy_ids = [UUID(e[entity_id_name]) for e in entities]
+        except (KeyError, TypeError, ValueError) as e:
+            raise EntityError(
+                f"Entity field {self.entity_name} does not contain valid ids"
+            ) from e
         proxy.proxy_attr[self.name] = proxy_ids
 
     def convert_proxy_to_entity(self, proxy, entity):
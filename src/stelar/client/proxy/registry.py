@@ -6,7 +6,7 @@ from weakref import WeakValueDictionary
 
 from .decl import ProxyState
 from .exceptions import ConflictError
-from .proxy import Proxy
+from .proxy import _ZERO_UUID, Proxy
 
 if TYPE_CHECKING:
     from ..client import Client
@@ -43,6 +43,9 @@ class Registry(Generic[ProxyClass]):
         self.catalog = catalog
         self.registry = WeakValueDictionary()
         self.proxy_type = proxy_type
+        # Extracts the entity id from an entity object (for entity types)
+        schema = getattr(proxy_type, "proxy_schema", None)
+        self.get_entity_id = schema.get_id if schema is not None else None
         if self.catalog is not None:
             self.catalog.add_registry_for(proxy_type, self)
 
@@ -59,7 +62,7 @@ class Registry(Generic[ProxyClass]):
         """
         if not isinstance(eid, UUID):
             raise ValueError("Expected UUID")
-        if eid == UUID(int=0):
+        if eid == _ZERO_UUID:
             raise ValueError("The null UUID(int=0) is not legal")
         proxy = self.registry.get(eid, None)
         if proxy is None:
@@ -80,7 +83,7 @@ class Registry(Generic[ProxyClass]):
         Returns:
          a proxy initialized with the provided entity.
         """
-        eid = UUID(self.proxy_type.proxy_schema.get_id(entity))
+        eid = UUID(self.get_entity_id(entity))
         proxy: Proxy = self.registry.get(eid, None)
         if proxy is None:
             proxy = self.proxy_type(registry=self, entity=entity)
@@ -89,13 +92,14 @@ class Registry(Generic[ProxyClass]):
             self.registry[proxy.proxy_id] = proxy
             proxy.proxy_sync(entity)
         else:
-            if proxy.proxy_state in (ProxyState.EMPTY, ProxyState.CLEAN):
+            state = proxy.proxy_state
+            if state is ProxyState.EMPTY or state is ProxyState.CLEAN:
                 proxy.proxy_sync(entity)
             else:
                 raise ConflictError(
                     proxy,
                     entity,
-                    f"Proxy fetched with new entity on state {proxy.proxy_state}",
+                    f"Proxy fetched with new entity on state {state}",
                 )
         return proxy
 
@@ -114,11 +118,11 @@ class Registry(Generic[ProxyClass]):
         """
         if proxy.proxy_id is None:
             raise ConflictError(proxy, entity, "Cannot register deleted proxy")
-        if proxy.proxy_id != UUID(int=0):
+        if proxy.proxy_id != _ZERO_UUID:
             raise ConflictError(
                 proxy, entity, f"Cannot register proxy with ID = {proxy.proxy_id}"
             )
-        eid = UUID(self.proxy_type.proxy_schema.get_id(entity))
+        eid = UUID(self.get_entity_id(entity))
         if eid in self.registry:
             raise ConflictError(
                 proxy, entity, f"Proxy for entity {eid} is already registered"
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from copy import copy
 from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
 
 from .property import Id, NameId, Property
 from .proxy import Proxy
+from .refs import Reference
 
 # ----------------------------------------------------------
 #  Proxy Schema
@@ -54,6 +54,9 @@ class Schema:
 
     # Declare attributes
     properties: dict[str, Property]
+    property_list: tuple[Property, ...]
+    defaultable_props: tuple[tuple[str, Property], ...]
+    trigger_sync_properties: tuple[Reference, ...]
 
     # Class attribute, registers schemas for entity names.
     entity_schema: dict[str, Schema] = dict()
@@ -136,9 +139,58 @@ class Schema:
             cls.id = self.id
             self.id.__set_name__(cls, "id")
 
+        # N.B. the id property is never included in 'properties'
+        self.property_list = tuple(self.properties.values())
+        # The properties given default values by 'Proxy.new()'
+        self.defaultable_props = tuple(
+            (prop.name, prop) for prop in self.property_list if not prop.isExtras
+        )
+        # The references whose proxies are synced after changes to this entity
+        self.trigger_sync_properties = tuple(
+            prop
+            for prop in self.property_list
+            if isinstance(prop, Reference) and prop.trigger_sync
+        )
+        self.from_entity_plan = self.make_from_entity_plan()
+        self.create_plan = self.make_create_plan()
+
         # Register yourself
         self.entity_schema[self.class_name] = self
 
+    def make_from_entity_plan(self) -> list[tuple]:
+        """Return the plan used by 'Proxy.proxy_from_entity()'.
+
+        For each property, the plan holds a tuple
+            (prop, name, entity_name, optional, convert_to_proxy)
+        For properties that specialize 'convert_entity_to_proxy()', the
+        last element is None, and the method must be called instead.
+        """
+        plan = []
+        for prop in self.property_list:
+            if type(prop).convert_entity_to_proxy is Property.convert_entity_to_proxy:
+                convert = prop._to_proxy
+            else:
+                convert = None
+            plan.append((prop, prop.name, prop.entity_name, prop.optional, convert))
+        return plan
+
+    def make_create_plan(self) -> list[tuple]:
+        """Return the plan used by 'Proxy.new_entity()'.
+
+        For each property, the plan holds a tuple
+            (prop, name, entity_name, validate, convert_to_entity)
+        For properties that specialize 'convert_to_create()', the last
+        element is None, and the method must be called instead.
+        """
+        plan = []
+        for prop in self.property_list:
+            if type(prop).convert_to_create is Property.convert_to_create:
+                convert = prop._to_entity
+            else:
+                convert = None
+            plan.append((prop, prop.name, prop.entity_name, prop._validate, convert))
+        return plan
+
     def get_id(self, entity) -> str:
         """Return the entity ID from the entity object"""
         return entity[self.id.entity_name]
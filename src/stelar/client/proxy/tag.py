@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from .typing import TagDictList, TagSpecList
 
 
+# The tags of an unknown vocabulary
+_NO_TAGS = frozenset()
+
+
 class VocabularyIndex:
     """This is a component to be included as part of a registry catalog.
     It is responsible for indexing the tag vocabularies of a STELAR API,
@@ -57,11 +61,13 @@ class VocabularyIndex:
         """The registry catalog"""
         self._id_to_name.clear()
         self._name_to_id.clear()
+        self._name_to_tags.clear()
+        self._id_to_tags.clear()
 
         for voc in self.catalog.fetch_active_vocabularies():
             vid = voc["id"]
             vname = voc["name"]
-            tags = {tag["name"] for tag in voc["tags"]}
+            tags = frozenset(tag["name"] for tag in voc["tags"])
             self._id_to_name[vid] = vname
             self._name_to_id[vname] = vid
             self._name_to_tags[vname] = tags
@@ -72,7 +78,7 @@ class VocabularyIndex:
     def validate_tagspec(self, tagspec: str) -> bool:
         """Check if a string is formatted correctly as a tagspec"""
         voc, tag = tag_split(tagspec)
-        return voc is None or tag in self.name_to_tags.get(voc, ())
+        return voc is None or tag in self.name_to_tags.get(voc, _NO_TAGS)
 
 
 class TagListField(AnyField):
@@ -83,15 +89,23 @@ class TagListField(AnyField):
     def to_taglist(self, tagl, *, vocindex, **kwargs):
         if isinstance(tagl, str):
             raise ValueError("An iterable of strings was expected, got a single string")
-        taglist = tuple(tagl)
-        if not all(isinstance(v, str) for v in taglist):
-            raise ValueError(
-                "Unexpected tagspec", [v for v in taglist if not isinstance(v, str)]
-            )
-        badts = [ts for ts in taglist if not vocindex.validate_tagspec(ts)]
+        # Check types and tagspecs in a single pass
+        taglist = []
+        badtypes = []
+        badts = []
+        validate = vocindex.validate_tagspec
+        for v in tagl:
+            if not isinstance(v, str):
+                badtypes.append(v)
+            elif not validate(v):
+                badts.append(v)
+            else:
+                taglist.append(v)
+        if badtypes:
+            raise ValueError("Unexpected tagspec", badtypes)
         if badts:
             raise ValueError("Tag list contains non-valid tagspec(s)", badts)
-        return taglist, True
+        return tuple(taglist), True
 
     def convert_to_entity(
         self, value: TagSpecList, *, vocindex: VocabularyIndex, **kwargs
@@ -143,4 +157,4 @@ class TagList(Property):
 class TaggableProxy(Proxy, entity=False):
     """A virtual base class for all proxies to entities that are taggable."""
 
-    pass
+    __slots__ = ()
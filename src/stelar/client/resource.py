@@ -1,7 +1,5 @@
 from typing import Any
 
-from IPython.core.display import HTML
-
 from .generic import GenericProxy, generic_proxy_sync
 from .proxy import (
     DateField,
@@ -14,6 +12,67 @@ from .proxy import (
     StrField,
 )
 
+# Define the watermark image URL (Replace with your image path)
+_WATERMARK_IMAGE_URL = "logo.png"
+
+# The static part of Resource._repr_html_(), filled in by %-formatting.
+# The watermark is constant, so it is filled in once, at import.
+_RESOURCE_HTML = """
+    <div style="position: relative; width: 100%%; height: auto; display: flex; justify-content: flex-start; align-items: flex-start; margin-bottom: 20px;">
+        <table border="1" style="
+            border-collapse: collapse;
+            width: 50%%;
+            margin: 0;
+            color: black;
+            background-image: url('%(watermark)s');
+            background-size: 20%%;
+            background-position: center;
+            background-repeat: no-repeat;">
+            <thead>
+                <tr>
+                    <th colspan="2" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
+                        Resource Summary
+                    </th>
+                </tr>
+                <tr style="background-color: rgba(242, 242, 242, 0.8);">
+                    <th style="width: 50%%; text-align: center;">Attribute</th>
+                    <th style="width: 50%%; text-align: center;">Value</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">ID:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(id)s</td>
+                </tr>
+                <tr style="background-color: rgba(230, 179, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Parent Package:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(dataset)s</td>
+                </tr>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Relation To Parent:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(relation)s</td>
+                </tr>
+                <tr style="background-color: rgba(230, 179, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Name:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(name)s</td>
+                </tr>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">URL:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;"><a href="%(url)s" target="_blank">%(url)s</a></td>
+                </tr>
+                <tr style="background-color: rgba(230, 179, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Format:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(format)s</td>
+                </tr>
+                <tr style="background-color: rgba(255, 255, 255, 0.8);">
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Description:</td>
+                    <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">%(description)s</td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+    """.replace("%(watermark)s", _WATERMARK_IMAGE_URL)
+
 
 class ExtrasResourceProperty(ExtrasProperty):
     """The handling of extras is different for Resource entities."""
@@ -46,6 +105,8 @@ class Resource(GenericProxy):
     A proxy for a STELAR resource with metadata and additional details.
     """
 
+    __slots__ = ()
+
     id = Id()
     dataset = Reference("Dataset", entity_name="package_id", trigger_sync=True)
     position = Property(validator=IntField)
@@ -77,28 +138,30 @@ class Resource(GenericProxy):
             raise AttributeError(attr) from e
 
     def __setattr__(self, attr, value):
-        if attr.startswith("proxy_") or attr in self.proxy_schema.all_fields:
+        schema = self.proxy_schema
+        if attr.startswith("proxy_") or attr in schema.all_fields:
             return object.__setattr__(self, attr, value)
 
-        prop = self.proxy_schema.extras
+        prop = schema.extras
 
         # TODO: value validation: It is not clear what to do, presumably the correct
         # value would be transformable to json
 
         prop.touch(self)
-        self.proxy_schema.extras.get(self)[attr] = value
+        prop.get(self)[attr] = value
         if self.proxy_autosync:
             self.proxy_sync()
 
     def __delattr__(self, attr):
-        if attr.startswith("proxy_") or attr in self.proxy_schema.all_fields:
+        schema = self.proxy_schema
+        if attr.startswith("proxy_") or attr in schema.all_fields:
             return object.__delattr__(self, attr)
 
-        prop = self.proxy_schema.extras
+        prop = schema.extras
         extras = prop.get(self)
         if attr in extras:
             prop.touch(self)
-            del extras[attr]
+            del prop.get(self)[attr]
             if self.proxy_autosync:
                 self.proxy_sync()
         else:
@@ -121,63 +184,14 @@ class Resource(GenericProxy):
         Provide an HTML representation of the Resource instance for Jupyter display,
         with enhanced styles, watermark, and consistent formatting.
         """
-        # Define the watermark image URL (Replace with your image path)
-        watermark_image_url = "logo.png"
-
-        # Build the table HTML
-        html = f"""
-        <div style="position: relative; width: 100%; height: auto; display: flex; justify-content: flex-start; align-items: flex-start; margin-bottom: 20px;">
-            <table border="1" style="
-                border-collapse: collapse;
-                width: 50%;
-                margin: 0;
-                color: black;
-                background-image: url('{watermark_image_url}');
-                background-size: 20%;
-                background-position: center;
-                background-repeat: no-repeat;">
-                <thead>
-                    <tr>
-                        <th colspan="2" style="text-align: center; padding: 10px; font-size: 18px; font-weight: bold; background-color: rgba(242, 242, 242, 0.8);">
-                            Resource Summary
-                        </th>
-                    </tr>
-                    <tr style="background-color: rgba(242, 242, 242, 0.8);">
-                        <th style="width: 50%; text-align: center;">Attribute</th>
-                        <th style="width: 50%; text-align: center;">Value</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">ID:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.id or 'N/A'}</td>
-                    </tr>
-                    <tr style="background-color: rgba(230, 179, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Parent Package:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.package_id or 'N/A'}</td>
-                    </tr>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Relation To Parent:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.relation or 'N/A'}</td>
-                    </tr>
-                    <tr style="background-color: rgba(230, 179, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Name:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.name}</td>
-                    </tr>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">URL:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;"><a href="{self.url}" target="_blank">{self.url}</a></td>
-                    </tr>
-                    <tr style="background-color: rgba(230, 179, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Format:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.format}</td>
-                    </tr>
-                    <tr style="background-color: rgba(255, 255, 255, 0.8);">
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd; font-weight: bold;">Description:</td>
-                        <td style="text-align: left; padding: 5px; border: 1px solid #ddd;">{self.description or 'N/A'}</td>
-                    </tr>
-                </tbody>
-            </table>
-        </div>
-        """
-        return HTML(html)._repr_html_()
+        dataset = self.dataset
+        html = _RESOURCE_HTML % {
+            "id": self.id or "N/A",
+            "dataset": dataset.id if dataset is not None else "N/A",
+            "relation": getattr(self, "relation", None) or "N/A",
+            "name": self.name,
+            "url": self.url,
+            "format": self.format,
+            "description": self.description or "N/A",
+        }
+        return html
@@ -8,6 +8,8 @@ from .proxy import BoolField, DateField, Id, NameId, Property, StateField, StrFi
 
 
 class User(GenericProxy):
+    __slots__ = ()
+
     id = Id()
     name = NameId()
 
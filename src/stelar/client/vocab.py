@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 class Vocabulary(GenericProxy):
     """Vocabulary proxy provides manipulation of tag vocabularies."""
 
+    __slots__ = ()
+
     id = Id()
     name = NameId(validator=VocabNameField)
     tags = RefList("Tag")
@@ -84,6 +86,8 @@ class Tag(GenericProxy):
     for datasets, groups, organizations, etc.)
     """
 
+    __slots__ = ()
+
     id = Id()
     name = NameId(validator=TagNameField)
     vocabulary = Reference(
@@ -14,6 +14,7 @@ from stelar.client.proxy import (
     Property,
     Proxy,
     ProxyState,
+    ProxySynclist,
     Schema,
     StrField,
     UUIDField,
@@ -599,3 +600,102 @@ def test_proxy_new():
 
     assert z.id != UUID(int=0)
     assert z.proxy_state is ProxyState.CLEAN
+
+
+def test_id_class_access():
+    class Foo(TestProxy):
+        a = Property(validator=IntField)
+
+    assert Foo.id is Foo.proxy_schema.id
+    assert isinstance(Foo.id, Id)
+
+
+def test_nested_deferred_sync():
+    class Foo(TestProxy):
+        a = Property(updatable=True)
+        b = Property(updatable=True)
+        data = {"a": 10, "b": 20}
+        nsync = 0
+
+        def proxy_sync(self, entity=None):
+            self.nsync += 1
+            super().proxy_sync(entity)
+
+    x = TPCatalog().registry_for(Foo).fetch(uuid4())
+    assert x.a == 10
+    x.nsync = 0
+
+    with deferred_sync(x):
+        x.update(a=1, b=2)
+        assert x.nsync == 0
+        x.a = 3
+        assert x.proxy_state is ProxyState.DIRTY
+    assert x.nsync == 1
+    assert x.proxy_state is ProxyState.CLEAN
+    assert x.data == {"a": 3, "b": 2}
+    assert x.proxy_autosync
+
+
+def test_deferred_sync_arguments():
+    class Foo(TestProxy):
+        a = Property(updatable=True)
+        data = {"a": 10}
+
+    r = TPCatalog().registry_for(Foo)
+    x, y = r.fetch(uuid4()), r.fetch(uuid4())
+
+    with pytest.raises(TypeError):
+        with deferred_sync(x, 1):
+            pass
+    with pytest.raises(ValueError, match="The 1-th argument"):
+        with deferred_sync(x, y, y):
+            pass
+    assert x.proxy_autosync and y.proxy_autosync
+
+
+def test_entity_slots():
+    from stelar.client import Dataset, Resource
+
+    for cls in (Dataset, Resource):
+        assert "__dict__" not in dir(cls)
+    assert "proxy_deferred" in Proxy.__slots__
+    assert "__weakref__" in Proxy.__slots__
+
+
+def test_proxy_to_series():
+    class Foo(TestProxy):
+        a = Property(validator=IntField)
+        b = Property(validator=IntField(nullable=True))
+        data = {"a": 10, "b": None}
+
+    x = TPCatalog().registry_for(Foo).fetch(uuid4())
+    x.proxy_sync()
+
+    s = x.proxy_to_Series()
+    assert list(s.index) == ["id", "a"]
+    assert s["a"] == 10
+    assert s.name == "Foo (CLEAN)"
+
+    s = x.proxy_to_Series(include_null=True)
+    assert list(s.index) == ["id", "a", "b"]
+    assert s["b"] is None
+
+
+def test_synclist_once():
+    class Foo(TestProxy):
+        a = Property()
+        data = {"a": 1}
+        nsync = 0
+
+        def proxy_sync(self, entity=None):
+            self.nsync += 1
+            super().proxy_sync(entity)
+
+    r = TPCatalog().registry_for(Foo)
+    x, y = r.fetch(uuid4()), r.fetch(uuid4())
+
+    psl = ProxySynclist([x, y])
+    psl.add(x)
+    psl.add(None)
+    psl.sync()
+    assert x.nsync == 1 and y.nsync == 1
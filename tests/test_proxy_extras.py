@@ -119,3 +119,24 @@ def test_extras_proxy_creation():
     assert x.b is None
     assert x.hehe == "hihi"
     assert x.extras == {"hehe": "hihi"}
+
+
+def test_extras_reset():
+    class Foo(ProxyTestObj, ExtrasProxy):
+        a = Property(validator=IntField, updatable=True)
+        extras = ExtrasProperty()
+
+    c = TPCatalog()
+
+    x = Foo.new(c, a=1, foo="bar", fozz="bozz")
+    x.proxy_autosync = False
+
+    saved = x.proxy_attr["extras"]
+    x.foo = "baz"
+    del x.fozz
+    x.hehe = "hihi"
+    assert x.extras == {"foo": "baz", "hehe": "hihi"}
+    assert saved == {"foo": "bar", "fozz": "bozz"}
+
+    x.proxy_reset()
+    assert x.extras == {"foo": "bar", "fozz": "bozz"}
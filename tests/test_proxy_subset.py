@@ -2,7 +2,16 @@ from uuid import uuid4
 
 from proxy_utils import ProxyTestObj, TPCatalog
 
-from stelar.client.proxy import Id, Property, Proxy, RefList, Registry
+from stelar.client.proxy import (
+    Id,
+    NameId,
+    Property,
+    Proxy,
+    ProxyVec,
+    Reference,
+    RefList,
+    Registry,
+)
 
 
 def test_simple_subset_decl():
@@ -42,3 +51,46 @@ def test_collection_init():
     c = TPCatalog()
     foo_cache = c.registry_for(Foo)
     bar_cache = c.registry_for(Bar)
+
+
+def test_proxyvec_to_df():
+    uuids = [uuid4() for i in range(3)]
+
+    class Foo(ProxyTestObj):
+        name = NameId()
+
+    Foo.data = {uuids[0]: {"id": str(uuids[0]), "name": "foo"}}
+
+    class Bar(ProxyTestObj):
+        id = Id()
+        b = Property(short=True)
+        foo = Reference(Foo, short=True)
+
+    Bar.data = {
+        u: {"id": str(u), "b": i, "foo": str(uuids[0])} for i, u in enumerate(uuids[1:])
+    }
+
+    c = TPCatalog()
+    bars = ProxyVec(c, Bar, uuids[1:])
+    df = bars.to_df()
+    assert list(df.columns) == ["id", "b", "foo"]
+    assert list(df["b"]) == [0, 1]
+    assert list(df["foo"]) == ["foo", "foo"]
+    assert str(df["id"][0]) == str(uuids[1])[:5] + "..."
+
+
+def test_proxyvec_slice():
+    uuids = [uuid4() for i in range(4)]
+
+    class Foo(ProxyTestObj):
+        a = Property()
+
+    c = TPCatalog()
+    foos = ProxyVec(c, Foo, uuids)
+    sub = foos[1:3]
+    assert isinstance(sub, ProxyVec)
+    assert sub.ids == uuids[1:3]
+    assert foos[-1].proxy_id == uuids[-1]
+    assert [p.proxy_id for p in foos[::2]] == uuids[::2]
+    assert foos[1:3] == ProxyVec(c, Foo, uuids[1:3])
+    assert foos[1:3] != ProxyVec(c, Foo, uuids[2:4])